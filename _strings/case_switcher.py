@@ -13,14 +13,18 @@ from __future__ import annotations
 
 import abc
 import enum
+import functools
 import re
 from typing import AnyStr
 
+_SPLIT_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\d|$)|[A-Z]?[a-z]+\d*|\d+")
+
 
 class _Case(abc.ABC):
     _pattern: str
     _example: str
     pattern: re.Pattern[AnyStr]
+    full_pattern: re.Pattern[AnyStr]
 
     @staticmethod
     @abc.abstractmethod
@@ -49,6 +53,7 @@ class SnakeCase(_Case):
     _pattern = r"\b\w+\b"
     _example = "snake_case"
     pattern = re.compile(_pattern)
+    full_pattern = re.compile(rf"^{_pattern}$")
 
     @staticmethod
     def from_case(text: str) -> list[str]:
@@ -63,6 +68,7 @@ class KebabCase(_Case):
     _pattern = r"\b[\dA-Za-z-]+\b"
     _example = "kebab-case"
     pattern = re.compile(_pattern)
+    full_pattern = re.compile(rf"^{_pattern}$")
 
     @staticmethod
     def from_case(text: str) -> list[str]:
@@ -77,6 +83,7 @@ class DotCase(_Case):
     _pattern = r"\b[\dA-Za-z.]+\b"
     _example = "dot.case"
     pattern = re.compile(_pattern)
+    full_pattern = re.compile(rf"^{_pattern}$")
 
     @staticmethod
     def from_case(text: str) -> list[str]:
@@ -91,10 +98,11 @@ class CamelCase(_Case):
     _pattern = r"\b[\dA-Za-z]+\b"
     _example = "camelCase"
     pattern = re.compile(_pattern)
+    full_pattern = re.compile(rf"^{_pattern}$")
 
     @staticmethod
     def from_case(text: str) -> list[str]:
-        return re.sub(r"([a-z])([A-Z])", r"\1_\2", text).split("_")
+        return _SPLIT_CAMEL.findall(text)
 
     @staticmethod
     def to_case(text: list[str]) -> str:
@@ -106,10 +114,11 @@ class PascalCase(_Case):
     _pattern = r"\b[\dA-Za-z]+\b"
     _example = "PascalCase"
     pattern = re.compile(_pattern)
+    full_pattern = re.compile(rf"^{_pattern}$")
 
     @staticmethod
     def from_case(text: str) -> list[str]:
-        return re.sub(r"([a-z])([A-Z])", r"\1_\2", text).split("_")
+        return _SPLIT_CAMEL.findall(text)
 
     @staticmethod
     def to_case(text: list[str]) -> str:
@@ -117,13 +126,14 @@ class PascalCase(_Case):
 
 
 class Case(enum.Enum):
-    SNAKE_CASE = SnakeCase()
-    KEBAB_CASE = KebabCase()
-    CAMEL_CASE = CamelCase()
-    PASCAL_CASE = PascalCase()
-    DOT_CASE = DotCase()
+    SNAKE_CASE = SnakeCase
+    KEBAB_CASE = KebabCase
+    CAMEL_CASE = CamelCase
+    PASCAL_CASE = PascalCase
+    DOT_CASE = DotCase
 
 
+@functools.lru_cache(maxsize=1024)
 def _switch_case(text: str, from_case: Case, to_case: Case) -> str:
     return to_case.value.to_case(
         from_case.value.from_case(
@@ -144,10 +154,13 @@ def switch_case(text: str, from_case: Case, to_case: Case) -> str:
     :param to_case: The case to change to.
     :return: The changed text.
     """
-    if re.search(f"^{from_case.value.pattern}$", text):
+    from_case_value = from_case.value
+    if from_case_value.full_pattern.fullmatch(text):
+        if from_case is Case.SNAKE_CASE and to_case is Case.PASCAL_CASE and "_" not in text:
+            return text.title()
         return _switch_case(text, from_case, to_case)
 
-    string = text
-    for item in re.findall(from_case.value.pattern, string):
-        string = re.sub(f"\\b{item}\\b", _switch_case(item, from_case, to_case), string)
-    return string
+    return from_case_value.pattern.sub(
+        lambda match: _switch_case(match.group(0), from_case, to_case),
+        text
+    )
@@ -1,7 +1,6 @@
 """
 Functions for callable manipulation.
 """
-import functools
 from typing import Callable
 
 
@@ -26,8 +25,9 @@ def compose(*functions: Callable) -> Callable:
     :param functions: The functions to compose from left to right.
     :return: The composed function.
     """
-    return functools.reduce(
-        lambda f, g: lambda x: f(g(x)),
-        functions[::-1],
-        lambda x: x
-    )
+    def composed(x):
+        for function in functions:
+            x = function(x)
+        return x
+
+    return composed
@@ -16,11 +16,17 @@ def is_date_valid(date_string: Any) -> bool:
     .. _Python Standard Library module datetime: https://docs.python.org/3/library/datetime.html
     .. _ISO-8601 standard: https://www.iso.org/iso-8601-date-and-time-format.html
 
+    Values that are not strings are not valid date strings.
+
     .. image:: https://imgs.xkcd.com/comics/iso_8601.png
 
     :return: ``True`` if the ``date_string`` is a valid ISO-8601 date string and
      ``False`` otherwise.
     """
+    # The shortest string ``fromisoformat`` accepts is ``YYYYWww`` and every
+    # accepted string starts with a 4-digit year, so skip raising for the rest
+    if not isinstance(date_string, str) or len(date_string) < 7 or not date_string[:4].isdigit():
+        return False
     try:
         datetime.datetime.fromisoformat(date_string.replace("Z", "+00:00"))
         return True
@@ -40,10 +46,21 @@ def string_to_date(
      ``datetime.date`` object. Defaults to ``%Y-%m-%d``.
     :return: A ``datetime.date`` object corresponding to the text and format.
     """
+    # ``fromisoformat`` also accepts other ISO forms (e.g. ``20240101``), so only
+    # use it for strings that are already shaped like ``%Y-%m-%d``
+    if (
+        date_format == "%Y-%m-%d"
+        and len(date_string) == 10
+        and date_string[4] == date_string[7] == "-"
+    ):
+        try:
+            return datetime.date.fromisoformat(date_string)
+        except ValueError:
+            pass
     return datetime.datetime.strptime(date_string, date_format).date()
 
 
-def _is_working_day(date: datetime.date, holidays: list[datetime.date]) -> bool:
+def _is_working_day(date: datetime.date, holidays: frozenset[datetime.date]) -> bool:
     """
     A date is a "working day" if it is neither a weekend nor a holiday.
     """
@@ -61,8 +78,6 @@ def add_working_days(
     """
     Add some number of working days to a date.
 
-    Note that this is an extremely naive implementation but works for now.
-
     :param from_date: The ``datetime.date`` to add some number of working days
      to.
     :param working_days: The number of working days to add to ``from_date``.
@@ -71,13 +86,30 @@ def add_working_days(
     :return: The ``datetime.date`` corresponding to the ``from_date`` plus the
      ``working_days``, accounting for holidays.
     """
-    if type(from_date) == str:
+    if isinstance(from_date, str):
         from_date = string_to_date(from_date)
+    if working_days <= 0:
+        return from_date
+
+    holidays_set = frozenset(holidays or ())
+
+    # Every 7 days contain 5 weekdays, so jump whole weeks first and then step
+    # through what's left (at least one day, so that we land on a working day)
+    # along with any weekday holidays that were jumped over. Holidays of another
+    # type (e.g. dates against a datetime) never match, as in ``_is_working_day``
+    weeks, remaining_days = divmod(working_days - 1, 5)
+    to_date = from_date + datetime.timedelta(weeks=weeks)
+    remaining_days += 1 + sum(
+        1
+        for holiday in holidays_set
+        if type(holiday) is type(from_date)
+        and from_date < holiday <= to_date
+        and holiday.weekday() < 5
+        and (holiday - from_date) % datetime.timedelta(days=1) == datetime.timedelta(0)
+    )
+    while remaining_days > 0:
+        to_date += datetime.timedelta(days=1)
+        if _is_working_day(to_date, holidays_set):
+            remaining_days -= 1
 
-    working_day_counter = 0
-    while working_day_counter < working_days:
-        from_date += datetime.timedelta(days=1)
-        if _is_working_day(from_date, holidays):
-            working_day_counter += 1
-
-    return from_date
+    return to_date
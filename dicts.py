@@ -3,6 +3,8 @@ Functions for dictionary manipulation.
 """
 from typing import Any
 
+_MISSING = object()
+
 
 def get_first_item_in_dict(dictionary: dict) -> tuple:
     """
@@ -21,12 +23,13 @@ def chained_get(dictionary: dict, *args, default: Any = None) -> Any:
      Defaults to ``None``.
     :return: The value in the dictionary at the nested path.
     """
-    value_path = list(args)
     dict_chain = dictionary
-    while value_path:
+    for key in args:
         try:
-            dict_chain = dict_chain.get(value_path.pop(0))
+            dict_chain = dict_chain.get(key, _MISSING)
         except AttributeError:
             return default
+        if dict_chain is _MISSING:
+            return default
 
     return dict_chain
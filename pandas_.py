@@ -48,13 +48,11 @@ def split_extract_by_flag(
     :return: A tuple of dataframes corresponding to the flag column equal to 1
      and 0, respectively.
     """
+    flags = dataframe[flag_column]
     if drop_flag:
-        return (
-            dataframe.loc[dataframe[flag_column] == 1, :].drop(flag_column, axis=1),
-            dataframe.loc[dataframe[flag_column] == 0, :].drop(flag_column, axis=1)
-        )
-    else:
-        return (
-            dataframe.loc[dataframe[flag_column] == 1, :],
-            dataframe.loc[dataframe[flag_column] == 0, :]
-        )
+        dataframe = dataframe.drop(flag_column, axis=1)
+
+    return (
+        dataframe.loc[flags.eq(1), :],
+        dataframe.loc[flags.eq(0), :]
+    )
@@ -3,9 +3,6 @@ Functions for string manipulation.
 """
 from __future__ import annotations
 
-import re
-import _strings.case_switcher
-
 
 def snake_to_pascal(snake_case_text: str) -> str:
     """
@@ -15,11 +12,7 @@ def snake_to_pascal(snake_case_text: str) -> str:
      single "word" so this function does not respect whitespace.
     :return: The string in Pascal case.
     """
-    return _strings.case_switcher.switch_case(
-        text=snake_case_text,
-        from_case=_strings.case_switcher.Case.SNAKE_CASE,
-        to_case=_strings.case_switcher.Case.PASCAL_CASE
-    )
+    return snake_case_text.title().replace("_", "")
 
 
 def clean_string(string: str, title_case: bool, if_null: str = None, override: bool = False) -> str | None:
@@ -44,13 +37,12 @@ def clean_string(string: str, title_case: bool, if_null: str = None, override: b
     """
     if not string:
         return if_null
-    if type(string) != str:
+    if not isinstance(string, str):
         return string
 
-    stripped = re.sub(r"\s+", " ", string.strip())
+    stripped = " ".join(string.split())
     if not title_case:
         return stripped
-    elif override:
+    if override or stripped.islower() or stripped.isupper():
         return stripped.title()
-    else:
-        return stripped.title() if (stripped.islower() or stripped.isupper()) else stripped
+    return stripped